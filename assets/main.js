@@ -0,0 +1,102 @@
+
+// Zendesk Help Center - Search and Interactivity
+document.addEventListener('DOMContentLoaded', function() {
+    // Search functionality - uses the generated inverted index
+    // (js/search_index.js) when present, so a keystroke costs a postings
+    // lookup instead of a full DOM scan
+    const searchInput = document.getElementById('searchInput');
+    if (searchInput) {
+        const searchIndex = window.SEARCH_INDEX || null;
+
+        function matchingArticleIds(query) {
+            const tokens = query.match(/\w+/g) || [];
+            let result = null;
+            tokens.forEach((token, i) => {
+                let ids = searchIndex.index[token];
+                if (ids === undefined && i === tokens.length - 1) {
+                    // Prefix-match the token still being typed
+                    ids = [];
+                    for (const term in searchIndex.index) {
+                        if (term.startsWith(token)) {
+                            ids = ids.concat(searchIndex.index[term]);
+                        }
+                    }
+                }
+                const idSet = new Set(ids || []);
+                result = result === null ? idSet : new Set([...result].filter(id => idSet.has(id)));
+            });
+            return result;
+        }
+
+        function cardText(article) {
+            const titleElement = article.querySelector('h3 a, h3');
+            const metaElement = article.querySelector('.article-meta');
+            const excerptElement = article.querySelector('.article-excerpt');
+            return [titleElement, metaElement, excerptElement]
+                .map(el => el ? el.textContent.toLowerCase() : '')
+                .join(' ');
+        }
+
+        function applyFilter(query) {
+            const articles = document.querySelectorAll('.article-item, .article-card');
+            if (query.length < 2) {
+                articles.forEach(article => { article.style.display = ''; });
+                return;
+            }
+            const matches = searchIndex ? matchingArticleIds(query) : null;
+            articles.forEach(article => {
+                const link = article.matches('a[href]') ? article : article.querySelector('a[href]');
+                const idMatch = link && /article_(\d+)\.html/.exec(link.getAttribute('href'));
+                let visible;
+                if (matches !== null && idMatch) {
+                    visible = matches.has(parseInt(idMatch[1], 10));
+                } else {
+                    // Fallback for cards that aren't articles (or no index loaded)
+                    visible = cardText(article).includes(query);
+                }
+                article.style.display = visible ? '' : 'none';
+            });
+        }
+
+        // Debounce so fast typing coalesces into one filter pass
+        let debounceTimer = null;
+        searchInput.addEventListener('input', function(e) {
+            const query = e.target.value.toLowerCase();
+            clearTimeout(debounceTimer);
+            debounceTimer = setTimeout(() => applyFilter(query), 150);
+        });
+    }
+
+    // Add active class to current page navigation
+    const currentPage = window.location.pathname.split('/').pop() || 'index.html';
+    const navLinks = document.querySelectorAll('.nav a');
+    navLinks.forEach(link => {
+        if (link.getAttribute('href') === currentPage) {
+            link.classList.add('active');
+        }
+    });
+    
+    // Smooth scrolling for anchor links
+    document.querySelectorAll('a[href^="#"]').forEach(anchor => {
+        anchor.addEventListener('click', function (e) {
+            e.preventDefault();
+            const target = document.querySelector(this.getAttribute('href'));
+            if (target) {
+                target.scrollIntoView({
+                    behavior: 'smooth',
+                    block: 'start'
+                });
+            }
+        });
+    });
+    
+    // Add loading states for images (exclude header logo)
+    const images = document.querySelectorAll('img:not(.header-logo)');
+    images.forEach(img => {
+        img.addEventListener('load', function() {
+            this.style.opacity = '1';
+        });
+        img.style.opacity = '0';
+        img.style.transition = 'opacity 0.3s ease';
+    });
+});
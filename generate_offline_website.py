@@ -4,1186 +4,395 @@ Offline Zendesk Help Center Website Generator
 Creates a static HTML website from exported Zendesk data
 """
 
+import gzip
+import heapq
 import json
+import operator
 import os
+import queue
 import re
+import shutil
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from urllib.parse import urlparse
 
+from jinja2 import Environment, FileSystemLoader
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Patterns used to strip markup and tokenize article bodies for the search
+# index, compiled once so the per-article loop skips the re-cache lookup
+_TAG_RE = re.compile(r'<[^>]+>')
+_WORD_RE = re.compile(r'\w+')
+
+# Icons and descriptions for the topic cards on the homepage and Browse Topics page
+SECTION_ICONS = {
+    'Study Setup': '📝',
+    'Interview Plan': '💬',
+    'Study Settings': '⚙️',
+    'Launch': '🚀',
+    'Responses and Recordings': '🎥',
+    'Settings and Admin': '👥',
+    'Results and Reports': '📊'
+}
+
+SECTION_DESCRIPTIONS = {
+    'Study Setup': 'Learn how to create and configure your research studies',
+    'Interview Plan': 'Set up discussion guides and interview sections',
+    'Study Settings': 'Configure AI moderator, devices, permissions, and more',
+    'Launch': 'Recruit participants and preview your study',
+    'Responses and Recordings': 'Manage recordings, clips, and participant responses',
+    'Settings and Admin': 'Manage your team and organization settings',
+    'Results and Reports': 'Analyze qualitative and quantitative research data'
+}
+
+# Blurbs for the tutorial videos page, keyed by filename
+VIDEO_DESCRIPTIONS = {
+    'Creating your study on Userology.mp4': 'Learn how to create and set up a new study on the Userology platform.',
+    'AI Discussion Guides.mp4': 'Understand how AI-powered discussion guides enhance your usability testing.',
+    'AI Moderator Configuration.mp4': 'Configure the AI moderator settings for your research sessions.',
+    'AI Transcript.mp4': 'Learn how to access and utilize AI-generated transcripts from your sessions.',
+    'Ask AI Feature.mp4': 'Discover how to use the Ask AI feature to get insights from your research data.',
+    'Configuring Devices and Browsers.mp4': 'Set up device and browser requirements for your study participants.',
+    'Downloading and Creating Clips.mp4': 'Learn how to download recordings and create clips from your research sessions.',
+    'Duplicating a study on userology.mp4': 'Quickly duplicate an existing study to save time on setup.',
+    'External Recruitment.mp4': 'Learn how to recruit participants from external sources for your studies.',
+    'Launching Your Study and Recruiting Participants.mp4': 'Complete guide to launching your study and recruiting participants.',
+    'Live Product Section.mp4': 'Set up and configure the live product testing section in your study.',
+    'Managing Team and Inviting Members.mp4': 'Add and manage team members in your Userology organization.',
+    'Organization settings.mp4': 'Configure your organization settings and preferences.',
+    'Personalizing Your Study.mp4': 'Customize your study with branding and personalization options.',
+    'Preview Session.mp4': 'Preview how your study will appear to participants before launching.',
+    'Prototype Section.mp4': 'Set up prototype testing sections for your design research.',
+    'QnA results.mp4': 'Analyze and interpret Q&A results from your research sessions.',
+    'Recording permission settings.mp4': 'Configure recording permissions and privacy settings for your studies.',
+    'Recordings page.mp4': 'Navigate and manage all your session recordings in one place.',
+    'Recruit Participant Yourself.mp4': 'Learn how to recruit and invite your own participants to studies.',
+    'Sign In Feature.mp4': 'Set up sign-in requirements for your study participants.',
+    'Time estimation feature.mp4': 'Use the time estimation feature to plan your study duration.',
+    'Types of responses .mp4': 'Understand the different types of responses you can collect in your studies.',
+    'Understanding Quantitative Results .mp4': 'Learn how to analyze and interpret quantitative data from your research.',
+    'Uploading a Legal Document to Your Study.mp4': 'Add consent forms and legal documents to your study setup.',
+    'Usability score.mp4': 'Understand and interpret usability scores from your testing sessions.',
+    'Voice Interview Section.mp4': 'Set up and conduct voice interviews as part of your research studies.'
+}
+
 class OfflineWebsiteGenerator:
     def __init__(self, export_dir="zendesk_export_userology"):
         self.export_dir = export_dir
         self.output_dir = "offline_help_center"
-        
+
+        # Compile all page templates once; the shared Environment caches the
+        # compiled templates so every page render reuses the same bytecode
+        self.env = Environment(
+            loader=FileSystemLoader("templates"),
+            autoescape=True,
+            auto_reload=False,
+            cache_size=-1,
+        )
+
         # Load data
         self.categories = self.load_json("categories.json")
         self.sections = self.load_json("sections.json")
         self.articles = self.load_json("articles.json")
         
-        # Create output directory with organized structure
-        os.makedirs(self.output_dir, exist_ok=True)
-        os.makedirs(f"{self.output_dir}/css", exist_ok=True)
-        os.makedirs(f"{self.output_dir}/js", exist_ok=True)
-        os.makedirs(f"{self.output_dir}/sections", exist_ok=True)
-        os.makedirs(f"{self.output_dir}/articles", exist_ok=True)
-        os.makedirs(f"{self.output_dir}/categories", exist_ok=True)
-        
-        # Create mappings for easy lookup
-        self.sections_by_category = {}
+        # Create output directory with organized structure, caching the
+        # subdirectory paths so per-page code doesn't re-concatenate them
+        self.css_dir = f"{self.output_dir}/css"
+        self.js_dir = f"{self.output_dir}/js"
+        self.sections_dir = f"{self.output_dir}/sections"
+        self.articles_dir = f"{self.output_dir}/articles"
+        self.categories_dir = f"{self.output_dir}/categories"
+        for path in (self.output_dir, self.css_dir, self.js_dir,
+                     self.sections_dir, self.articles_dir, self.categories_dir):
+            os.makedirs(path, exist_ok=True)
+
+        # Bound format callables for per-id output paths, so the page loops
+        # only substitute the id instead of rebuilding the whole path
+        self.article_path = (self.articles_dir + '/article_{}.html').format
+        self.section_path = (self.sections_dir + '/section_{}.html').format
+        self.category_path = (self.categories_dir + '/category_{}.html').format
+        
+        # Create mappings for easy lookup - one pass over sections and one
+        # over articles builds every index and count together
+        self.categories_by_id = {c['id']: c for c in self.categories}
+        self.sections_by_id = {}
+        self.sections_by_category = defaultdict(list)
         self.articles_by_section = {}
-        
+        self.article_counts = {}
+
         for section in self.sections:
-            cat_id = section['category_id']
-            if cat_id not in self.sections_by_category:
-                self.sections_by_category[cat_id] = []
-            self.sections_by_category[cat_id].append(section)
-            
             section_id = section['id']
+            self.sections_by_id[section_id] = section
+            self.sections_by_category[section['category_id']].append(section)
             self.articles_by_section[section_id] = []
-        
+            self.article_counts[section_id] = 0
+
         for article in self.articles:
             section_id = article['section_id']
             if section_id in self.articles_by_section:
                 self.articles_by_section[section_id].append(article)
+                self.article_counts[section_id] += 1
+
+        # Six most recently updated articles, shown on the homepage; nlargest
+        # only tracks the head instead of sorting the whole list
+        self.recent_articles = heapq.nlargest(6, self.articles, key=lambda a: a['updated_at'])
+
+        # Title order for the All Articles index, sorted once at load time
+        self.articles_by_title = sorted(self.articles, key=operator.itemgetter('title'))
+
+        # One timestamp for the whole run, so every page of a batch agrees
+        # on when the site was generated
+        self.generated_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+        # Scan the tutorial videos folder once up front
+        self.videos = self._scan_videos()
+
+        # Newest mtime across every generator input; output files newer than
+        # all of them can be skipped on incremental rebuilds. The script
+        # itself counts (page constants live here), as does the videos
+        # directory, whose mtime moves when tutorials are added or removed
+        input_paths = [f"{self.export_dir}/{name}" for name in
+                       ("categories.json", "sections.json", "articles.json")]
+        input_paths += [entry.path for entry in os.scandir("templates")]
+        input_paths.append(__file__)
+        if os.path.isdir("videos"):
+            input_paths.append("videos")
+        mtimes = {path: os.path.getmtime(path) for path in input_paths}
+        self.source_mtime = max(mtimes.values())
+
+        # Everything an article page depends on apart from the article
+        # itself, so unchanged articles can still be skipped after a
+        # re-export touches articles.json
+        self.article_deps_mtime = max(mtime for path, mtime in mtimes.items()
+                                      if not path.endswith("articles.json"))
+
+        # All file output funnels through one writer thread fed by a bounded
+        # queue, so renderers never block on open/write/close syscalls and
+        # small-file writes are amortized into a single sequential stream
+        self._write_q = queue.Queue(maxsize=256)
+        self._write_error = None
+        self._writer = threading.Thread(target=self._writer_loop, name="page-writer", daemon=True)
+        self._writer.start()
 
     def load_json(self, filename):
         """Load JSON data from export directory"""
-        with open(f"{self.export_dir}/{filename}", 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(f"{self.export_dir}/{filename}", 'rb') as f:
+            data = f.read()
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
+
+    def up_to_date(self, path):
+        """True if an output file is already newer than every generator input"""
+        try:
+            return os.path.getmtime(path) >= self.source_mtime
+        except OSError:
+            return False
+
+    def _writer_loop(self):
+        """Drain the write queue until the ``None`` sentinel arrives, writing
+        each finished payload with a single buffered binary write"""
+        while True:
+            item = self._write_q.get()
+            if item is None:
+                self._write_q.task_done()
+                return
+            try:
+                # After a failure keep draining but stop writing, so
+                # producers never block on a full queue behind a dead writer
+                if self._write_error is None:
+                    path, data = item
+                    with open(path, 'wb', buffering=65536) as f:
+                        f.write(data)
+            except Exception as exc:
+                self._write_error = exc
+            self._write_q.task_done()
+
+    def _finish_writes(self):
+        """Signal the writer thread that no more pages are coming, wait for
+        everything queued to reach disk, and surface any write failure"""
+        self._write_q.put(None)
+        self._writer.join()
+        if self._write_error is not None:
+            raise self._write_error
+
+    def stream_page(self, path, template_name, **context):
+        """Render a template to bytes and hand it to the writer thread,
+        skipping pages whose output is already current"""
+        if self.up_to_date(path):
+            return
+        data = self.env.get_template(template_name).render(**context).encode('utf-8')
+        self._write_q.put((path, data))
+        self.queue_compressed(path, data)
+
+    def queue_compressed(self, path, data):
+        """Queue precompressed siblings (.gz, plus .br when brotli is installed)
+        so a static server with gzip_static/brotli_static on can serve pages
+        without spending CPU per request"""
+        self._write_q.put((path + '.gz', gzip.compress(data, compresslevel=9)))
+        if brotli is not None:
+            self._write_q.put((path + '.br', brotli.compress(data, quality=11)))
+
+    def compress_page(self, path):
+        """Queue precompressed siblings for a file already on disk"""
+        with open(path, 'rb') as f:
+            data = f.read()
+        self.queue_compressed(path, data)
+
+    def publish_asset(self, src, dst):
+        """Publish a static asset, hardlinking when possible to skip the data copy"""
+        try:
+            if os.path.exists(dst):
+                os.remove(dst)
+            os.link(src, dst)
+        except OSError:
+            # Cross-filesystem or unsupported; copyfile uses the kernel's
+            # zero-copy fast path (sendfile/copy_file_range) where available
+            shutil.copyfile(src, dst)
 
     def create_css(self):
-        """Create CSS styling for the help center"""
-        css_content = """/* Userology Help Center - Clean Professional Design */
-
-:root {
-    /* Colors - Clean and Professional */
-    --color-primary: #3b82f6;
-    --color-primary-dark: #2563eb;
-    --color-primary-light: #60a5fa;
-
-    --color-text: #111827;
-    --color-text-light: #6b7280;
-    --color-text-lighter: #9ca3af;
-
-    --color-bg: #ffffff;
-    --color-bg-gray: #f9fafb;
-    --color-bg-light: #f3f4f6;
-
-    --color-border: #e5e7eb;
-    --color-border-light: #f3f4f6;
-
-    /* Spacing */
-    --space-1: 0.25rem;
-    --space-2: 0.5rem;
-    --space-3: 0.75rem;
-    --space-4: 1rem;
-    --space-5: 1.25rem;
-    --space-6: 1.5rem;
-    --space-8: 2rem;
-    --space-10: 2.5rem;
-    --space-12: 3rem;
-    --space-16: 4rem;
-
-    /* Typography */
-    --font-sans: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif;
-    --font-mono: "SF Mono", Monaco, Consolas, monospace;
-
-    /* Shadows - Subtle */
-    --shadow-sm: 0 1px 2px 0 rgba(0, 0, 0, 0.05);
-    --shadow-md: 0 4px 6px -1px rgba(0, 0, 0, 0.08);
-    --shadow-hover: 0 8px 16px -4px rgba(0, 0, 0, 0.12);
-
-    /* Radius */
-    --radius-sm: 0.375rem;
-    --radius-md: 0.5rem;
-    --radius-lg: 0.75rem;
-    --radius-xl: 1rem;
-}
-
-* {
-    margin: 0;
-    padding: 0;
-    box-sizing: border-box;
-}
-
-body {
-    font-family: var(--font-sans);
-    font-size: 16px;
-    line-height: 1.6;
-    color: var(--color-text);
-    background: var(--color-bg-gray);
-    -webkit-font-smoothing: antialiased;
-    -moz-osx-font-smoothing: grayscale;
-}
-
-/* Remove ALL underlines from links globally */
-a {
-    text-decoration: none;
-    color: inherit;
-}
-
-/* Container */
-.container {
-    max-width: 1200px;
-    margin: 0 auto;
-    padding: 0 var(--space-6);
-}
-
-/* ========== HEADER ========== */
-.header {
-    background: var(--color-bg);
-    border-bottom: 1px solid var(--color-border);
-    padding: var(--space-6) 0;
-    position: sticky;
-    top: 0;
-    z-index: 100;
-    box-shadow: var(--shadow-sm);
-}
-
-.header-content {
-    display: flex;
-    align-items: center;
-    justify-content: space-between;
-    gap: var(--space-8);
-}
-
-.header-branding {
-    display: flex;
-    align-items: center;
-    gap: var(--space-4);
-}
-
-.header-logo {
-    width: 40px;
-    height: 40px;
-    object-fit: contain;
-    opacity: 1;
-}
-
-.header-text h1 {
-    font-size: 1.5rem;
-    font-weight: 700;
-    color: var(--color-text);
-    margin: 0;
-    line-height: 1.2;
-}
-
-.header-text p {
-    font-size: 0.875rem;
-    color: var(--color-text-light);
-    margin: 0;
-}
-
-/* ========== SEARCH ========== */
-.search-container {
-    flex: 1;
-    max-width: 500px;
-}
-
-.search-input {
-    width: 100%;
-    padding: var(--space-3) var(--space-4);
-    border: 1px solid var(--color-border);
-    border-radius: var(--radius-lg);
-    font-size: 0.9375rem;
-    transition: all 0.2s;
-    background: var(--color-bg);
-}
-
-.search-input:focus {
-    outline: none;
-    border-color: var(--color-primary);
-    box-shadow: 0 0 0 3px rgba(59, 130, 246, 0.1);
-}
-
-.search-input::placeholder {
-    color: var(--color-text-lighter);
-}
-
-/* ========== NAVIGATION ========== */
-.nav {
-    background: var(--color-bg);
-    border-bottom: 1px solid var(--color-border);
-}
-
-.nav ul {
-    list-style: none;
-    display: flex;
-    gap: var(--space-2);
-}
-
-.nav a {
-    display: block;
-    padding: var(--space-4) var(--space-5);
-    color: var(--color-text-light);
-    font-weight: 500;
-    font-size: 0.9375rem;
-    border-bottom: 2px solid transparent;
-    transition: all 0.2s;
-}
-
-.nav a:hover {
-    color: var(--color-primary);
-    background: var(--color-bg-light);
-}
-
-.nav a.active {
-    color: var(--color-primary);
-    border-bottom-color: var(--color-primary);
-}
-
-/* ========== MAIN LAYOUT ========== */
-.main {
-    display: grid;
-    grid-template-columns: 260px 1fr;
-    gap: var(--space-8);
-    margin: var(--space-8) 0;
-    align-items: start;
-}
-
-/* Pages without sidebar (categories, articles) */
-.main:not(:has(.sidebar)) {
-    grid-template-columns: 1fr;
-    max-width: 1400px;
-    margin: var(--space-8) auto;
-}
-
-/* ========== SIDEBAR ========== */
-.sidebar {
-    background: var(--color-bg);
-    border: 1px solid var(--color-border);
-    border-radius: var(--radius-lg);
-    padding: var(--space-6);
-    position: sticky;
-    top: 140px;
-}
-
-.sidebar h3 {
-    font-size: 1rem;
-    font-weight: 700;
-    color: var(--color-text);
-    margin: 0 0 var(--space-4) 0;
-}
-
-.sidebar ul {
-    list-style: none;
-}
-
-.sidebar a {
-    display: block;
-    padding: var(--space-3) var(--space-4);
-    color: var(--color-text-light);
-    font-size: 0.9375rem;
-    border-radius: var(--radius-md);
-    transition: all 0.2s;
-}
-
-.sidebar a:hover {
-    color: var(--color-primary);
-    background: var(--color-bg-light);
-}
-
-/* ========== CONTENT AREA ========== */
-.content {
-    background: var(--color-bg);
-    border: 1px solid var(--color-border);
-    border-radius: var(--radius-lg);
-    padding: var(--space-10);
-    min-height: 500px;
-}
-
-/* Content without sidebar - more breathing room */
-.main:not(:has(.sidebar)) .content {
-    padding: var(--space-12);
-    border: none;
-    background: transparent;
-}
-
-.content h1 {
-    font-size: 2rem;
-    font-weight: 700;
-    color: var(--color-text);
-    margin: 0 0 var(--space-6) 0;
-    line-height: 1.2;
-}
-
-.content > p {
-    font-size: 1.0625rem;
-    color: var(--color-text-light);
-    margin: 0 0 var(--space-8) 0;
-}
-
-.content h2 {
-    font-size: 1.5rem;
-    font-weight: 700;
-    color: var(--color-text);
-    margin: var(--space-12) 0 var(--space-6) 0;
-}
-
-/* First h2 (like "Popular Articles") */
-.content h2:first-of-type {
-    margin-top: var(--space-10);
-}
-
-.content h3 {
-    font-size: 1.25rem;
-    font-weight: 600;
-    color: var(--color-text);
-    margin: var(--space-8) 0 var(--space-4) 0;
-}
-
-.content h4 {
-    font-size: 1.125rem;
-    font-weight: 600;
-    color: var(--color-text);
-    margin: var(--space-6) 0 var(--space-3) 0;
-}
-
-.content p {
-    margin: 0 0 var(--space-4) 0;
-    line-height: 1.7;
-}
-
-.content a {
-    color: var(--color-primary);
-    font-weight: 500;
-}
-
-.content a:hover {
-    color: var(--color-primary-dark);
-}
-
-.content ul,
-.content ol {
-    margin: var(--space-4) 0;
-    padding-left: var(--space-8);
-}
-
-.content li {
-    margin-bottom: var(--space-2);
-    line-height: 1.7;
-}
-
-.content img {
-    max-width: 100%;
-    height: auto;
-    border-radius: var(--radius-md);
-    margin: var(--space-6) 0;
-}
-
-/* YouTube embeds */
-.youtube-container {
-    position: relative;
-    width: 100%;
-    padding-bottom: 56.25%;
-    margin: var(--space-8) 0;
-    border-radius: var(--radius-lg);
-    overflow: hidden;
-}
-
-.youtube-container iframe {
-    position: absolute;
-    top: 0;
-    left: 0;
-    width: 100%;
-    height: 100%;
-    border: none;
-}
-
-/* ========== ARTICLE GRID - PROPER GRID LAYOUT ========== */
-.article-grid {
-    display: grid;
-    grid-template-columns: repeat(auto-fill, minmax(340px, 1fr));
-    gap: var(--space-8);
-    margin: var(--space-8) 0 0 0;
-}
-
-/* Home page - 2 column max */
-.main:has(.sidebar) .article-grid {
-    grid-template-columns: repeat(auto-fill, minmax(300px, 1fr));
-}
-
-/* Categories/Articles pages - 3 column */
-.main:not(:has(.sidebar)) .article-grid {
-    grid-template-columns: repeat(auto-fill, minmax(360px, 1fr));
-    gap: var(--space-6);
-}
-
-/* Single category - center it and make it bigger */
-.article-grid:has(:only-child) {
-    grid-template-columns: 1fr;
-    max-width: 600px;
-}
-
-.article-grid:has(:only-child) .article-card {
-    padding: var(--space-10);
-    min-height: 200px;
-    text-align: center;
-    justify-content: center;
-}
-
-/* ========== ARTICLE CARDS - CLEAN & MINIMAL ========== */
-.article-card {
-    display: flex;
-    flex-direction: column;
-    background: var(--color-bg);
-    border: 1px solid var(--color-border);
-    border-radius: var(--radius-lg);
-    padding: var(--space-8);
-    transition: all 0.2s ease;
-    cursor: pointer;
-    min-height: 140px;
-}
-
-/* Remove any text decoration on card and children */
-.article-card,
-.article-card *,
-.article-card:hover,
-.article-card:hover * {
-    text-decoration: none !important;
-}
-
-.article-card:hover {
-    border-color: var(--color-primary);
-    box-shadow: var(--shadow-hover);
-    transform: translateY(-2px);
-}
-
-.article-card h3 {
-    font-size: 1.125rem;
-    font-weight: 600;
-    color: var(--color-text);
-    line-height: 1.5;
-    margin: 0 0 auto 0;
-    flex-grow: 1;
-    transition: color 0.2s;
-}
-
-.article-card:hover h3 {
-    color: var(--color-primary);
-}
-
-.article-card .article-meta {
-    font-size: 0.875rem;
-    color: var(--color-text-lighter);
-    margin: var(--space-4) 0 0 0;
-    padding-top: var(--space-4);
-    border-top: 1px solid var(--color-border-light);
-}
-
-/* Legacy article items */
-.article-list {
-    display: grid;
-    gap: var(--space-4);
-}
-
-.article-item {
-    background: var(--color-bg);
-    border: 1px solid var(--color-border);
-    border-radius: var(--radius-lg);
-    padding: var(--space-6);
-    transition: all 0.2s;
-}
-
-.article-item:hover {
-    border-color: var(--color-primary);
-    box-shadow: var(--shadow-md);
-}
-
-.article-item h3 {
-    font-size: 1.125rem;
-    font-weight: 600;
-    margin: 0 0 var(--space-2) 0;
-}
-
-.article-item h3 a {
-    color: var(--color-text);
-}
-
-.article-item h3 a:hover {
-    color: var(--color-primary);
-}
-
-.article-meta {
-    font-size: 0.875rem;
-    color: var(--color-text-lighter);
-}
-
-.article-excerpt {
-    color: var(--color-text-light);
-    font-size: 0.9375rem;
-    line-height: 1.6;
-    margin-top: var(--space-2);
-}
-
-/* Breadcrumb */
-.breadcrumb {
-    display: inline-flex;
-    align-items: center;
-    gap: var(--space-2);
-    font-size: 0.875rem;
-    color: var(--color-text-lighter);
-    margin-bottom: var(--space-6);
-    padding: var(--space-2) var(--space-4);
-    background: var(--color-bg-light);
-    border-radius: var(--radius-md);
-}
-
-.breadcrumb a {
-    color: var(--color-primary);
-}
-
-.breadcrumb a:hover {
-    color: var(--color-primary-dark);
-}
-
-/* ========== FOOTER ========== */
-.footer {
-    background: var(--color-text);
-    color: rgba(255, 255, 255, 0.8);
-    text-align: center;
-    padding: var(--space-12) 0;
-    margin-top: var(--space-16);
-}
-
-.footer p {
-    font-size: 0.875rem;
-    margin: 0;
-}
-
-/* ========== RESPONSIVE ========== */
-@media (max-width: 1024px) {
-    .main {
-        grid-template-columns: 1fr;
-    }
-
-    .sidebar {
-        position: static;
-        order: 2;
-    }
-
-    .content {
-        order: 1;
-    }
-
-    .article-grid,
-    .main:has(.sidebar) .article-grid,
-    .main:not(:has(.sidebar)) .article-grid {
-        grid-template-columns: repeat(auto-fill, minmax(300px, 1fr));
-    }
-}
-
-@media (max-width: 768px) {
-    .container {
-        padding: 0 var(--space-4);
-    }
-
-    .header-content {
-        flex-direction: column;
-        align-items: stretch;
-        gap: var(--space-4);
-    }
-
-    .search-container {
-        max-width: none;
-    }
-
-    .nav ul {
-        flex-direction: column;
-        gap: 0;
-    }
-
-    .nav a {
-        border-bottom: none;
-        border-left: 2px solid transparent;
-    }
-
-    .nav a.active {
-        border-left-color: var(--color-primary);
-    }
-
-    .content {
-        padding: var(--space-6);
-    }
-
-    .content h1 {
-        font-size: 1.75rem;
-    }
-
-    .article-grid,
-    .main:has(.sidebar) .article-grid,
-    .main:not(:has(.sidebar)) .article-grid {
-        grid-template-columns: 1fr;
-        gap: var(--space-5);
-    }
-
-    .main:not(:has(.sidebar)) .content {
-        padding: var(--space-6);
-    }
-}
-
-@media (max-width: 480px) {
-    .content {
-        padding: var(--space-5);
-    }
-
-    .content h1 {
-        font-size: 1.5rem;
-    }
-}
-
-/* ========== ACCESSIBILITY ========== */
-*:focus-visible {
-    outline: 2px solid var(--color-primary);
-    outline-offset: 2px;
-}
-
-/* Print styles */
-@media print {
-    .nav,
-    .sidebar,
-    .footer,
-    .search-container {
-        display: none;
-    }
-
-    .main {
-        grid-template-columns: 1fr;
-    }
-
-    .content {
-        border: none;
-        box-shadow: none;
-    }
-}
-
-/* Reduced motion */
-@media (prefers-reduced-motion: reduce) {
-    * {
-        animation-duration: 0.01ms !important;
-        transition-duration: 0.01ms !important;
-    }
-}
-
-/* ========== VIDEO GRID & CARDS ========== */
-.video-grid {
-    display: grid;
-    grid-template-columns: repeat(auto-fill, minmax(360px, 1fr));
-    gap: var(--space-8);
-    margin: var(--space-8) 0 0 0;
-}
-
-.video-card {
-    display: flex;
-    flex-direction: column;
-    background: var(--color-bg);
-    border: 1px solid var(--color-border);
-    border-radius: var(--radius-lg);
-    overflow: hidden;
-    transition: all 0.2s ease;
-}
-
-.video-card:hover {
-    border-color: var(--color-primary);
-    box-shadow: var(--shadow-hover);
-    transform: translateY(-2px);
-}
-
-.video-thumbnail {
-    width: 100%;
-    aspect-ratio: 16 / 9;
-    background: var(--color-bg-light);
-    overflow: hidden;
-    position: relative;
-}
-
-.video-thumbnail video {
-    width: 100%;
-    height: 100%;
-    object-fit: cover;
-    display: block;
-    background: #000;
-}
-
-.video-info {
-    padding: var(--space-6);
-    flex: 1;
-}
-
-.video-info h3 {
-    font-size: 1.125rem;
-    font-weight: 600;
-    color: var(--color-text);
-    line-height: 1.4;
-    margin: 0 0 var(--space-3) 0;
-}
-
-.video-description {
-    font-size: 0.9375rem;
-    color: var(--color-text-light);
-    line-height: 1.6;
-    margin: 0;
-}
-
-/* Video player responsive */
-@media (max-width: 768px) {
-    .video-grid {
-        grid-template-columns: 1fr;
-        gap: var(--space-6);
-    }
-}
-
-/* ========== TOPIC CARDS (for Browse Topics page) ========== */
-.topic-grid {
-    display: grid;
-    grid-template-columns: repeat(auto-fill, minmax(320px, 1fr));
-    gap: var(--space-6);
-    margin: var(--space-8) 0 var(--space-12) 0;
-}
-
-.topic-card {
-    display: flex;
-    flex-direction: column;
-    background: var(--color-bg);
-    border: 2px solid var(--color-border);
-    border-radius: var(--radius-lg);
-    padding: var(--space-8);
-    transition: all 0.2s ease;
-    cursor: pointer;
-    text-align: center;
-}
-
-.topic-card:hover {
-    border-color: var(--color-primary);
-    box-shadow: var(--shadow-hover);
-    transform: translateY(-2px);
-}
-
-.topic-icon {
-    font-size: 3rem;
-    margin-bottom: var(--space-4);
-    line-height: 1;
-}
-
-.topic-card h3 {
-    font-size: 1.25rem;
-    font-weight: 700;
-    color: var(--color-text);
-    margin: 0 0 var(--space-3) 0;
-    line-height: 1.3;
-}
-
-.topic-description {
-    font-size: 0.9375rem;
-    color: var(--color-text-light);
-    line-height: 1.6;
-    margin: 0 0 var(--space-4) 0;
-    flex-grow: 1;
-}
-
-.topic-meta {
-    font-size: 0.875rem;
-    color: var(--color-text-lighter);
-    font-weight: 500;
-    padding-top: var(--space-4);
-    border-top: 1px solid var(--color-border-light);
-}
-
-/* Topic grid responsive */
-@media (max-width: 768px) {
-    .topic-grid {
-        grid-template-columns: 1fr;
-        gap: var(--space-5);
-    }
-}
-"""
-        
-        with open(f"{self.output_dir}/css/style.css", 'w', encoding='utf-8') as f:
-            f.write(css_content)
+        """Publish the stylesheet from the static assets directory"""
+        self.publish_asset("assets/style.css", f"{self.css_dir}/style.css")
+        self.compress_page(f"{self.css_dir}/style.css")
 
     def create_javascript(self):
-        """Create JavaScript for search and interactivity"""
-        js_content = """
-// Zendesk Help Center - Search and Interactivity
-document.addEventListener('DOMContentLoaded', function() {
-    // Search functionality
-    const searchInput = document.getElementById('searchInput');
-    if (searchInput) {
-        searchInput.addEventListener('input', function(e) {
-            const query = e.target.value.toLowerCase();
-            if (query.length < 2) return;
-            
-            // Simple client-side search
-            const articles = document.querySelectorAll('.article-item, .article-card');
-            articles.forEach(article => {
-                const titleElement = article.querySelector('h3 a, h3');
-                const metaElement = article.querySelector('.article-meta');
-                const excerptElement = article.querySelector('.article-excerpt');
-                
-                const title = titleElement ? titleElement.textContent.toLowerCase() : '';
-                const meta = metaElement ? metaElement.textContent.toLowerCase() : '';
-                const excerpt = excerptElement ? excerptElement.textContent.toLowerCase() : '';
-                
-                if (title.includes(query) || meta.includes(query) || excerpt.includes(query)) {
-                    article.style.display = 'block';
-                } else {
-                    article.style.display = 'none';
-                }
-            });
-        });
-    }
-    
-    // Add active class to current page navigation
-    const currentPage = window.location.pathname.split('/').pop() || 'index.html';
-    const navLinks = document.querySelectorAll('.nav a');
-    navLinks.forEach(link => {
-        if (link.getAttribute('href') === currentPage) {
-            link.classList.add('active');
-        }
-    });
-    
-    // Smooth scrolling for anchor links
-    document.querySelectorAll('a[href^="#"]').forEach(anchor => {
-        anchor.addEventListener('click', function (e) {
-            e.preventDefault();
-            const target = document.querySelector(this.getAttribute('href'));
-            if (target) {
-                target.scrollIntoView({
-                    behavior: 'smooth',
-                    block: 'start'
-                });
-            }
-        });
-    });
-    
-    // Add loading states for images (exclude header logo)
-    const images = document.querySelectorAll('img:not(.header-logo)');
-    images.forEach(img => {
-        img.addEventListener('load', function() {
-            this.style.opacity = '1';
-        });
-        img.style.opacity = '0';
-        img.style.transition = 'opacity 0.3s ease';
-    });
-});
-"""
-        
-        with open(f"{self.output_dir}/js/main.js", 'w', encoding='utf-8') as f:
-            f.write(js_content)
+        """Publish the search/interactivity script from the static assets directory"""
+        self.publish_asset("assets/main.js", f"{self.js_dir}/main.js")
+        self.compress_page(f"{self.js_dir}/main.js")
+
+    def create_logo(self):
+        """Publish the logo referenced by every page header"""
+        self.publish_asset("assets/logo.png", f"{self.output_dir}/logo.png")
+
+    def build_search_index(self):
+        """Build an inverted word index over article titles and bodies for client-side search"""
+        index_path = f"{self.js_dir}/search_index.js"
+        if self.up_to_date(index_path):
+            return
+        articles_meta = {}
+        index = {}
 
-    def get_header_html(self, title, description="Get help with Userology", is_root=True, include_search=True):
-        """Get the common header HTML for all pages"""
-        # Adjust paths based on whether we're in root or subdirectory
-        path_prefix = "" if is_root else "../"
-        
-        # Search container only on root pages (index, categories, articles, videos)
-        search_html = ""
-        if include_search:
-            search_html = f"""
-                <div class="search-container">
-                    <input type="search" class="search-input" placeholder="Search articles..." id="searchInput">
-                </div>"""
-        
-        return f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title} - Userology Help Center</title>
-    <link rel="stylesheet" href="{path_prefix}css/style.css">
-    <link rel="icon" type="image/png" href="{path_prefix}logo.png">
-</head>
-<body>
-    <header class="header">
-        <div class="container">
-            <div class="header-content">
-                <div class="header-branding">
-                    <img src="{path_prefix}logo.png" alt="Userology Logo" class="header-logo">
-                    <div class="header-text">
-                        <h1>Userology Help Center</h1>
-                        <p>{description}</p>
-                    </div>
-                </div>{search_html}
-            </div>
-        </div>
-    </header>
+        for article in self.articles:
+            section = self.sections_by_id.get(article['section_id'])
+            body_text = _TAG_RE.sub(' ', article.get('body', ''))
+            tokens = set(_WORD_RE.findall(f"{article['title']} {body_text}".lower()))
+
+            articles_meta[article['id']] = {
+                'title': article['title'],
+                'section': section['name'] if section else 'Unknown',
+                'href': f"articles/article_{article['id']}.html",
+            }
+            for token in tokens:
+                index.setdefault(token, []).append(article['id'])
 
-    <nav class="nav">
-        <div class="container">
-            <ul>
-                <li><a href="{path_prefix}index.html">Home</a></li>
-                <li><a href="{path_prefix}categories.html">Browse Topics</a></li>
-                <li><a href="{path_prefix}articles.html">All Articles</a></li>
-                <li><a href="{path_prefix}videos.html">Videos</a></li>
-            </ul>
-        </div>
-    </nav>"""
+        payload = json.dumps({'articles': articles_meta, 'index': index}, ensure_ascii=False)
 
-    def get_footer_html(self, is_root=True, include_script=False):
-        """Get the common footer HTML for all pages"""
-        path_prefix = "" if is_root else "../"
-        script_tag = f'\n    <script src="{path_prefix}js/main.js"></script>' if include_script else ''
-        return f"""
-    <footer class="footer">
-        <div class="container">
-            <p>© 2025 Userology. All rights reserved.</p>
-        </div>
-    </footer>{script_tag}
-</body>
-</html>"""
+        # Emitted as a script that sets a global rather than a JSON file,
+        # because the site is browsed over file:// where fetch() is blocked
+        data = ("// Generated search index - do not edit\nwindow.SEARCH_INDEX = " + payload + ";\n").encode('utf-8')
+        self._write_q.put((index_path, data))
+        self.queue_compressed(index_path, data)
 
     def create_homepage(self):
         """Create the main homepage with Browse by Topic section"""
-        html_content = self.get_header_html("Home", "Get help with Userology", is_root=True)
-        
-        html_content += """
-    <div class="container">
-        <main class="main">
-            <div class="content">
-                <h1>Welcome to Userology Help Center</h1>
-                <p>Find comprehensive guides, tutorials, and answers to help you get the most out of Userology.</p>
-
-                <h2>Browse by Topic</h2>
-                <div class="topic-grid">
-"""
-        
-        # Create topic cards for sections
-        section_icons = {
-            'Study Setup': '📝',
-            'Interview Plan': '💬',
-            'Study Settings': '⚙️',
-            'Launch': '🚀',
-            'Responses and Recordings': '🎥',
-            'Settings and Admin': '👥',
-            'Results and Reports': '📊'
-        }
-        
-        section_descriptions = {
-            'Study Setup': 'Learn how to create and configure your research studies',
-            'Interview Plan': 'Set up discussion guides and interview sections',
-            'Study Settings': 'Configure AI moderator, devices, permissions, and more',
-            'Launch': 'Recruit participants and preview your study',
-            'Responses and Recordings': 'Manage recordings, clips, and participant responses',
-            'Settings and Admin': 'Manage your team and organization settings',
-            'Results and Reports': 'Analyze qualitative and quantitative research data'
-        }
-        
-        for section in self.sections:
-            articles_count = len(self.articles_by_section.get(section['id'], []))
-            icon = section_icons.get(section['name'], '📄')
-            description = section_descriptions.get(section['name'], section.get('description', ''))
-            
-            html_content += f"""
-                    <a href="sections/section_{section['id']}.html" class="topic-card">
-                        <div class="topic-icon">{icon}</div>
-                        <h3>{section['name']}</h3>
-                        <p class="topic-description">{description}</p>
-                        <div class="topic-meta">{articles_count} {'article' if articles_count == 1 else 'articles'}</div>
-                    </a>
-"""
-        
-        html_content += """
-                </div>
-
-                <h2>Popular Articles</h2>
-                <div class="article-grid">
-"""
-        
-        # Show recent articles (last 6)
-        recent_articles = sorted(self.articles, key=lambda x: x['updated_at'], reverse=True)[:6]
-        for article in recent_articles:
-            section = next((s for s in self.sections if s['id'] == article['section_id']), None)
-            
-            html_content += f"""
-                    <a href="articles/article_{article['id']}.html" class="article-card">
-                        <h3>{article['title']}</h3>
-                        <div class="article-meta">
-                            {section['name'] if section else 'Unknown'}
-                        </div>
-                    </a>
-"""
-        
-        html_content += """
-                </div>
-            </div>
-        </main>
-    </div>
-
-    <footer class="footer">
-        <div class="container">
-            <p>© 2025 Userology. All rights reserved.</p>
-        </div>
-    </footer>
-
-    <!-- <script src="js/main.js"></script> -->
-</body>
-</html>"""
-        
-        with open(f"{self.output_dir}/index.html", 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        # Pair the precomputed recent articles with their section names
+        recent_articles = []
+        for article in self.recent_articles:
+            section = self.sections_by_id.get(article['section_id'])
+            recent_articles.append((article, section['name'] if section else 'Unknown'))
+
+        self.stream_page(
+            f"{self.output_dir}/index.html",
+            "homepage.html",
+            title="Home",
+            description="Get help with Userology",
+            path_prefix="",
+            include_search=True,
+            sections=self.sections,
+            icons=SECTION_ICONS,
+            descriptions=SECTION_DESCRIPTIONS,
+            article_counts=self.article_counts,
+            recent_articles=recent_articles,
+        )
 
     def create_category_page(self, category):
         """Create a category page in categories folder"""
         sections = self.sections_by_category.get(category['id'], [])
-        
-        html_content = self.get_header_html(category['name'], "Browse help topics organized by category", is_root=False)
-        
-        html_content += f"""
-    <div class="container">
-        <main class="main">
-            <aside class="sidebar">
-                <h3>Sections in {category['name']}</h3>
-                <ul>
-"""
-        
-        for section in sections:
-            html_content += f'                    <li><a href="../sections/section_{section["id"]}.html">{section["name"]}</a></li>\n'
-        
-        html_content += f"""
-                </ul>
-            </aside>
 
-            <div class="content">
-                <h1>{category['name']}</h1>
-                <p>{category.get('description', '')}</p>
-                
-                <h2>Sections</h2>
-                <div class="article-list">
-"""
-        
-        for section in sections:
-            articles = self.articles_by_section.get(section['id'], [])
-            html_content += f"""
-                    <div class="article-item">
-                        <h3><a href="../sections/section_{section['id']}.html">{section['name']}</a></h3>
-                        <div class="article-meta">
-                            {len(articles)} articles
-                        </div>
-                    </div>
-"""
-        
-        html_content += """
-                </div>
-            </div>
-        </main>
-    </div>
-"""
-        
-        html_content += self.get_footer_html(is_root=False)
-        
-        with open(f"{self.output_dir}/categories/category_{category['id']}.html", 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        self.stream_page(
+            self.category_path(category['id']),
+            "category.html",
+            title=category['name'],
+            description="Browse help topics organized by category",
+            path_prefix="../",
+            include_search=True,
+            category=category,
+            sections=sections,
+            article_counts=self.article_counts,
+        )
 
     def create_section_page(self, section):
         """Create a section page in sections folder"""
         articles = self.articles_by_section.get(section['id'], [])
-        category = next((c for c in self.categories if c['id'] == section['category_id']), None)
-        
-        html_content = self.get_header_html(section['name'], "Your complete guide to using Userology", is_root=False, include_search=False)
-        
-        html_content += f"""
-    <div class="container">
-        <main class="main">
-            <aside class="sidebar">
-                <h3>Articles in {section['name']}</h3>
-                <ul>
-"""
-        
-        for article in articles:
-            html_content += f'                    <li><a href="../articles/article_{article["id"]}.html">{article["title"]}</a></li>\n'
-        
-        html_content += f"""
-                </ul>
-            </aside>
-
-            <div class="content">
-                <h1>{section['name']}</h1>
-                
-                
-                <h2>Articles</h2>
-                <div class="article-list">
-"""
-        
-        for article in articles:
-            html_content += f"""
-                    <div class="article-item">
-                        <h3><a href="../articles/article_{article['id']}.html">{article['title']}</a></h3>
-                        <div class="article-meta">
-                            Updated: {article['updated_at'][:10]}
-                        </div>
-                    </div>
-"""
-        
-        html_content += """
-                </div>
-            </div>
-        </main>
-    </div>
 
-    <footer class="footer">
-        <div class="container">
-            <p>© 2025 Userology. All rights reserved.</p>
-        </div>
-    </footer>
-</body>
-</html>"""
-        
-        with open(f"{self.output_dir}/sections/section_{section['id']}.html", 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        self.stream_page(
+            self.section_path(section['id']),
+            "section.html",
+            title=section['name'],
+            description="Your complete guide to using Userology",
+            path_prefix="../",
+            include_search=False,
+            section=section,
+            articles=articles,
+        )
 
     def create_article_page(self, article):
         """Create an article page in articles folder"""
-        section = next((s for s in self.sections if s['id'] == article['section_id']), None)
-        category = next((c for c in self.categories if c['id'] == section['category_id']), None) if section else None
-        
-        # Use article body directly - it's already properly formatted from the HTML
-        article_body = article.get('body', '')
-        
-        html_content = self.get_header_html(article['title'], "Your complete guide to using Userology", is_root=False, include_search=False)
-        
-        html_content += f"""
-    <div class="container">
-        <main class="main">
-            <aside class="sidebar">
-                <h3>Navigation</h3>
-                <ul>
-                    <li><a href="../index.html">← Back to Home</a></li>
-"""
-        
-        if category:
-            html_content += f'                    <li><a href="../categories/category_{category["id"]}.html">← {category["name"]}</a></li>\n'
-        if section:
-            html_content += f'                    <li><a href="../sections/section_{section["id"]}.html">← {section["name"]}</a></li>\n'
-        
-        html_content += f"""
-                </ul>
-            </aside>
-
-            <div class="content">
-                <h1>{article['title']}</h1>
-                <div class="article-meta">
-                    {category['name'] if category else 'Unknown'} → {section['name'] if section else 'Unknown'} | 
-                    Updated: {article['updated_at'][:10]}
-                </div>
-                
-                <div class="article-content">
-                    {article_body}
-                </div>
-            </div>
-        </main>
-    </div>
-
-    <footer class="footer">
-        <div class="container">
-            <p>© 2025 Userology. All rights reserved.</p>
-        </div>
-    </footer>
-</body>
-</html>"""
-        
-        with open(f"{self.output_dir}/articles/article_{article['id']}.html", 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        path = self.article_path(article['id'])
+
+        # The global source check invalidates every article as soon as
+        # articles.json is re-exported; compare against this article's own
+        # updated_at as well so only genuinely changed articles re-render
+        try:
+            out_mtime = os.path.getmtime(path)
+        except OSError:
+            out_mtime = None
+        if out_mtime is not None and out_mtime >= self.article_deps_mtime:
+            updated_at = article['updated_at']
+            updated = datetime.fromisoformat(updated_at).timestamp()
+            if 'T' not in updated_at and ' ' not in updated_at:
+                # Date-only values parse as midnight, but the edit could
+                # have landed any moment that day; treat them as end-of-day
+                # so a same-day re-export is never skipped as stale
+                updated += 86400
+            if out_mtime >= updated:
+                return
+
+        section = self.sections_by_id.get(article['section_id'])
+        category = self.categories_by_id.get(section['category_id']) if section else None
+
+        self.stream_page(
+            path,
+            "article.html",
+            title=article['title'],
+            description="Your complete guide to using Userology",
+            path_prefix="../",
+            include_search=False,
+            article=article,
+            section=section,
+            category=category,
+        )
 
     def create_all_pages(self):
         """Create all pages"""
@@ -1192,219 +401,112 @@ document.addEventListener('DOMContentLoaded', function() {
         
         print("Creating JavaScript...")
         self.create_javascript()
-        
-        print("Creating homepage...")
-        self.create_homepage()
-        
-        print("Creating category pages...")
-        for category in self.categories:
-            self.create_category_page(category)
-        
-        print("Creating section pages...")
-        for section in self.sections:
-            self.create_section_page(section)
-        
-        print("Creating article pages...")
-        for article in self.articles:
-            self.create_article_page(article)
-        
-        print("Creating index pages...")
-        self.create_categories_index()
-        self.create_articles_index()
-        self.create_videos_page()
 
-    def create_videos_page(self):
-        """Create videos.html page with all video tutorials"""
-        import os
-        
-        # Get all video files from videos folder
-        videos_dir = "videos"
+        print("Copying logo...")
+        self.create_logo()
+
+        print("Building search index...")
+        self.build_search_index()
+
+        # Pages are independent of each other, so every render goes through
+        # one producer pool feeding the writer thread: workers build and
+        # encode HTML while the writer streams finished pages to disk.
+        # Page builders only read shared state and the Jinja environment is
+        # thread-safe for renders
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 4) * 2)) as executor:
+            print("Creating index pages...")
+            index_futures = [executor.submit(self.create_homepage),
+                             executor.submit(self.create_categories_index),
+                             executor.submit(self.create_articles_index),
+                             executor.submit(self.create_videos_page)]
+
+            print("Creating category pages...")
+            list(executor.map(self.create_category_page, self.categories))
+
+            print("Creating section pages...")
+            list(executor.map(self.create_section_page, self.sections))
+
+            print("Creating article pages...")
+            list(executor.map(self.create_article_page, self.articles))
+
+            # map() raises worker exceptions when its results are consumed;
+            # give the submitted index pages the same treatment
+            for future in index_futures:
+                future.result()
+
+        self._finish_writes()
+
+    def _scan_videos(self, videos_dir="videos"):
+        """Collect tutorial video entries from the videos folder, paired with
+        their descriptions"""
         videos = []
-        
-        if os.path.exists(videos_dir):
-            video_files = [f for f in os.listdir(videos_dir) if f.endswith('.mp4')]
-            
-            # Video descriptions mapping
-            video_descriptions = {
-                'Creating your study on Userology.mp4': 'Learn how to create and set up a new study on the Userology platform.',
-                'AI Discussion Guides.mp4': 'Understand how AI-powered discussion guides enhance your usability testing.',
-                'AI Moderator Configuration.mp4': 'Configure the AI moderator settings for your research sessions.',
-                'AI Transcript.mp4': 'Learn how to access and utilize AI-generated transcripts from your sessions.',
-                'Ask AI Feature.mp4': 'Discover how to use the Ask AI feature to get insights from your research data.',
-                'Configuring Devices and Browsers.mp4': 'Set up device and browser requirements for your study participants.',
-                'Downloading and Creating Clips.mp4': 'Learn how to download recordings and create clips from your research sessions.',
-                'Duplicating a study on userology.mp4': 'Quickly duplicate an existing study to save time on setup.',
-                'External Recruitment.mp4': 'Learn how to recruit participants from external sources for your studies.',
-                'Launching Your Study and Recruiting Participants.mp4': 'Complete guide to launching your study and recruiting participants.',
-                'Live Product Section.mp4': 'Set up and configure the live product testing section in your study.',
-                'Managing Team and Inviting Members.mp4': 'Add and manage team members in your Userology organization.',
-                'Organization settings.mp4': 'Configure your organization settings and preferences.',
-                'Personalizing Your Study.mp4': 'Customize your study with branding and personalization options.',
-                'Preview Session.mp4': 'Preview how your study will appear to participants before launching.',
-                'Prototype Section.mp4': 'Set up prototype testing sections for your design research.',
-                'QnA results.mp4': 'Analyze and interpret Q&A results from your research sessions.',
-                'Recording permission settings.mp4': 'Configure recording permissions and privacy settings for your studies.',
-                'Recordings page.mp4': 'Navigate and manage all your session recordings in one place.',
-                'Recruit Participant Yourself.mp4': 'Learn how to recruit and invite your own participants to studies.',
-                'Sign In Feature.mp4': 'Set up sign-in requirements for your study participants.',
-                'Time estimation feature.mp4': 'Use the time estimation feature to plan your study duration.',
-                'Types of responses .mp4': 'Understand the different types of responses you can collect in your studies.',
-                'Understanding Quantitative Results .mp4': 'Learn how to analyze and interpret quantitative data from your research.',
-                'Uploading a Legal Document to Your Study.mp4': 'Add consent forms and legal documents to your study setup.',
-                'Usability score.mp4': 'Understand and interpret usability scores from your testing sessions.',
-                'Voice Interview Section.mp4': 'Set up and conduct voice interviews as part of your research studies.'
-            }
-            
-            for video_file in sorted(video_files):
-                video_name = os.path.splitext(video_file)[0]
+        if os.path.isdir(videos_dir):
+            with os.scandir(videos_dir) as it:
+                video_files = sorted(e.name for e in it
+                                     if e.is_file() and e.name.endswith('.mp4'))
+            for video_file in video_files:
                 videos.append({
                     'filename': video_file,
-                    'title': video_name,
-                    'description': video_descriptions.get(video_file, '')
+                    'title': os.path.splitext(video_file)[0],
+                    'description': VIDEO_DESCRIPTIONS.get(video_file, '')
                 })
-        
-        html_content = self.get_header_html("Video Tutorials", "Watch video tutorials to learn how to use Userology", is_root=True)
-        
-        html_content += """
-    <div class="container">
-        <main class="main">
-            <div class="content">
-                <h1>Video Tutorials</h1>
-                <p>Watch step-by-step video guides to help you master Userology features. Click on any video to watch.</p>
+        return videos
 
-                <div class="video-grid">
-"""
-        
-        for video in videos:
-            html_content += f"""
-                    <div class="video-card">
-                        <div class="video-thumbnail">
-                            <video controls preload="metadata">
-                                <source src="videos/{video['filename']}" type="video/mp4">
-                                Your browser does not support the video tag.
-                            </video>
-                        </div>
-                        <div class="video-info">
-                            <h3>{video['title']}</h3>
-                            <p class="video-description">{video['description']}</p>
-                        </div>
-                    </div>
-"""
-        
-        html_content += """
-                </div>
-            </div>
-        </main>
-    </div>
-"""
-        
-        html_content += self.get_footer_html(is_root=True, include_script=True)
-        
-        with open(f"{self.output_dir}/videos.html", 'w', encoding='utf-8') as f:
-            f.write(html_content)
+    def create_videos_page(self):
+        """Create videos.html page with all video tutorials"""
+        if self.up_to_date(f"{self.output_dir}/videos.html"):
+            return
+        self.stream_page(
+            f"{self.output_dir}/videos.html",
+            "videos.html",
+            title="Video Tutorials",
+            description="Watch video tutorials to learn how to use Userology",
+            path_prefix="",
+            include_search=True,
+            videos=self.videos,
+        )
 
     def create_categories_index(self):
         """Create Browse Topics index page with topic grid"""
-        html_content = self.get_header_html("Browse Topics", "Browse help topics organized by category", is_root=True)
-        
-        html_content += """
-    <div class="container">
-        <main class="main">
-            <div class="content">
-                <h1>Browse Topics</h1>
-                <p>Find articles organized by topic to help you get started quickly.</p>
-
-                <div class="topic-grid">
-"""
-        
-        # Create topic cards for sections
-        section_icons = {
-            'Study Setup': '📝',
-            'Interview Plan': '💬',
-            'Study Settings': '⚙️',
-            'Launch': '🚀',
-            'Responses and Recordings': '🎥',
-            'Settings and Admin': '👥',
-            'Results and Reports': '📊'
-        }
-        
-        section_descriptions = {
-            'Study Setup': 'Learn how to create and configure your research studies',
-            'Interview Plan': 'Set up discussion guides and interview sections',
-            'Study Settings': 'Configure AI moderator, devices, permissions, and more',
-            'Launch': 'Recruit participants and preview your study',
-            'Responses and Recordings': 'Manage recordings, clips, and participant responses',
-            'Settings and Admin': 'Manage your team and organization settings',
-            'Results and Reports': 'Analyze qualitative and quantitative research data'
-        }
-        
-        for section in self.sections:
-            articles_count = len(self.articles_by_section.get(section['id'], []))
-            icon = section_icons.get(section['name'], '📄')
-            description = section_descriptions.get(section['name'], section.get('description', ''))
-            
-            html_content += f"""
-                    <a href="sections/section_{section['id']}.html" class="topic-card">
-                        <div class="topic-icon">{icon}</div>
-                        <h3>{section['name']}</h3>
-                        <p class="topic-description">{description}</p>
-                        <div class="topic-meta">{articles_count} {'article' if articles_count == 1 else 'articles'}</div>
-                    </a>
-"""
-        
-        html_content += """
-                </div>
-            </div>
-        </main>
-    </div>
-"""
-        
-        html_content += self.get_footer_html(is_root=True, include_script=True)
-        
-        with open(f"{self.output_dir}/categories.html", 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        if self.up_to_date(f"{self.output_dir}/categories.html"):
+            return
+        self.stream_page(
+            f"{self.output_dir}/categories.html",
+            "categories_index.html",
+            title="Browse Topics",
+            description="Browse help topics organized by category",
+            path_prefix="",
+            include_search=True,
+            sections=self.sections,
+            icons=SECTION_ICONS,
+            descriptions=SECTION_DESCRIPTIONS,
+            article_counts=self.article_counts,
+        )
 
     def create_articles_index(self):
         """Create articles index page"""
-        html_content = self.get_header_html("All Articles", "Browse all help articles", is_root=True)
-        
-        html_content += """
-    <div class="container">
-        <main class="main">
-            <div class="content">
-                <h1>All Articles</h1>
-                <div class="article-grid">
-"""
-        
-        for article in sorted(self.articles, key=lambda x: x['title']):
-            section = next((s for s in self.sections if s['id'] == article['section_id']), None)
-            category = next((c for c in self.categories if c['id'] == section['category_id']), None) if section else None
-            
-            html_content += f"""
-                    <a href="articles/article_{article['id']}.html" class="article-card">
-                        <h3>{article['title']}</h3>
-                        <div class="article-meta">
-                            {category['name'] if category else 'Unknown'} → {section['name'] if section else 'Unknown'}
-                        </div>
-                    </a>
-"""
-        
-        html_content += """
-                </div>
-            </div>
-        </main>
-    </div>
-
-    <footer class="footer">
-        <div class="container">
-            <p>Offline Help Center - Generated on """ + datetime.now().strftime('%Y-%m-%d %H:%M:%S') + """</p>
-        </div>
-    </footer>
-</body>
-</html>"""
-        
-        with open(f"{self.output_dir}/articles.html", 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        if self.up_to_date(f"{self.output_dir}/articles.html"):
+            return
+        articles = []
+        for article in self.articles_by_title:
+            section = self.sections_by_id.get(article['section_id'])
+            category = self.categories_by_id.get(section['category_id']) if section else None
+            articles.append((
+                article,
+                category['name'] if category else 'Unknown',
+                section['name'] if section else 'Unknown',
+            ))
+
+        self.stream_page(
+            f"{self.output_dir}/articles.html",
+            "articles_index.html",
+            title="All Articles",
+            description="Browse all help articles",
+            path_prefix="",
+            include_search=True,
+            articles=articles,
+            footer_text="Offline Help Center - Generated on " + self.generated_at,
+        )
 
 def main():
     print("🚀 Generating offline help center website...")